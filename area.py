@@ -1,5 +1,6 @@
+import array
 import pickle
-import re
+import struct
 import tkinter as tk
 from abc import ABC, abstractmethod
 from tkinter import filedialog as fd
@@ -10,7 +11,40 @@ from typing import Callable
 InputRow = tuple[float, float, float]
 InputData = list[InputRow]
 StoreRowType = tuple[tk.StringVar, tk.StringVar, tk.StringVar]
-StorageType = dict[int, StoreRowType]
+StorageType = list[StoreRowType]
+
+# Minimum row count before the numpy path beats the plain loop
+_NUMPY_THRESHOLD = 64
+
+# Minimum row count before the numba kernel beats plain numpy
+_NUMBA_THRESHOLD = 256
+
+# Optional JIT-compiled reduction kernel; numba is not required
+try:
+    from numba import njit
+except ImportError:
+    _area_kernel = None
+else:
+
+    @njit(cache=True, fastmath=True)
+    def _area_kernel(arr):
+        s = 0.0
+        for i in range(arr.shape[0]):
+            s += arr[i, 0] * arr[i, 1] * arr[i, 2]
+        return s
+
+# Magic prefix of the packed binary .area file format
+_FILE_MAGIC = b"AREA\x01"
+
+# Input unit data, indexed by unit id. The factor converts a squared
+# value in the unit to square feet with a single multiplication.
+_UNITS = (
+    {"name": "Inches", "symbol": "in", "factor": 1.0 / 144.0},
+    {"name": "Centimeter", "symbol": "cm", "factor": 0.032808399**2},
+)
+
+# Square-feet conversion factors alone, for the hot result path
+_FACTORS = tuple(unit["factor"] for unit in _UNITS)
 
 
 class Store:
@@ -18,49 +52,74 @@ class Store:
     data for file handling."""
 
     def __init__(self) -> None:
-        self.storage: StorageType = {}
+        self.storage: StorageType = []
+        self._vars: dict[str, tk.StringVar] = {}
+        self._cache: dict[str, float] = {}
+        self._dirty: set[str] = set()
+        self._traces: dict[str, str] = {}
 
-    @property
-    def units(self):
-        """an readonly class property which contains all the input unit data
+    def add(self, values: StoreRowType) -> None:
+        """Add a tuple of values to storage.
 
-        Returns:
-            dict: database of unit convertion logic
+        Args:
+            values (StoreRowType): tuple of values of entries
         """
-        return {
-            0: {"name": "Inches", "symbol": "in", "calc": lambda x: x / (12**2)},
-            1: {
-                "name": "Centimeter",
-                "symbol": "cm",
-                "calc": lambda x: x * (0.032808399**2),
-            },
-        }
-
-    def add(self, values: StoreRowType) -> Callable[[ttk.Frame], Callable[[], None]]:
-        """Add a tuple of values to storage.
+        self.storage.append(values)
+
+        # cache parsed floats keyed by Tcl variable name (StringVar itself
+        # is unhashable) and re-parse only on write
+        for strvar in values:
+            name = str(strvar)
+            self._vars[name] = strvar
+            self._cache[name] = self.to_float(strvar)
+            self._traces[name] = strvar.trace_add(
+                "write", lambda *_, key=name: self._dirty.add(key)
+            )
+
+    def make_destroyer(
+        self, values: StoreRowType, frame: ttk.Frame, idx: int
+    ) -> Callable[[], None]:
+        """create the destruction function for a stored row of values.
 
         Args:
             values (StoreRowType): tuple of values of entries
+            frame (ttk.Frame): frame holding the row widgets
+            idx (int): grid row of the widgets in the frame
 
         Returns:
-            Callable[[ttk.Frame], Callable[[], None]]: a callable function to be
-        called when the row is to be destroyed.
+            Callable[[], None]: a callable function to be called when the
+        row is to be destroyed.
         """
-        id = len(self.storage)
-        self.storage[id] = values
 
-        # row destruction function
-        def delete_row(frame: ttk.Frame) -> Callable[[], None]:
-            def destroy():
-                frame.destroy()
-                del self.storage[id]
+        def destroy():
+            for widget in frame.grid_slaves(row=idx):
+                widget.destroy()
+            self.storage.remove(values)
+            for strvar in values:
+                self._drop(strvar)
 
-            return destroy
+        return destroy
 
-        return delete_row
+    def _drop(self, strvar: tk.StringVar):
+        """detach a string variable: remove its write trace and forget its
+        cached state
+
+        Args:
+            strvar (tk.StringVar): an instance of string variable
+        """
+        name = str(strvar)
+        cbname = self._traces.pop(name, None)
+        if cbname is not None:
+            strvar.trace_remove("write", cbname)
+        self._vars.pop(name, None)
+        self._cache.pop(name, None)
+        self._dirty.discard(name)
 
     def clear(self):
         """clear the data in storage"""
+        for row in self.storage:
+            for strvar in row:
+                self._drop(strvar)
         self.storage.clear()
 
     def to_float(self, strvar: tk.StringVar) -> float:
@@ -72,9 +131,12 @@ class Store:
         Returns:
             float: converted float value
         """
+        s = strvar.get()
+        if not s or s == ".":
+            return 0.0
         try:
-            return float(strvar.get())
-        except:
+            return float(s)
+        except ValueError:
             return 0.0
 
     def values(self) -> InputData:
@@ -83,10 +145,37 @@ class Store:
         Returns:
             InputData: a datatype which is iteratable and serialisable
         """
-        converted: InputData = []
-        for _, row in self.storage.items():
-            converted.append(tuple(self.to_float(r) for r in row))
-        return converted
+        self._refresh()
+
+        # bind the cache locally and unroll the 3-element rows
+        cache = self._cache
+        return [
+            (cache[str(a)], cache[str(b)], cache[str(c)])
+            for a, b, c in self.storage
+        ]
+
+    def _refresh(self):
+        """re-parse only the variables written since the last read"""
+        if self._dirty:
+            to_float = self.to_float
+            vars = self._vars
+            for name in self._dirty:
+                self._cache[name] = to_float(vars[name])
+            self._dirty.clear()
+
+    def sum_products(self) -> float:
+        """accumulate length x width x count over all rows in a single pass,
+        without building an intermediate list.
+
+        Returns:
+            float: sum of the row products
+        """
+        self._refresh()
+        cache = self._cache
+        result = 0.0
+        for a, b, c in self.storage:
+            result += cache[str(a)] * cache[str(b)] * cache[str(c)]
+        return result
 
 
 class Window(tk.Tk, ABC):
@@ -110,36 +199,26 @@ class Window(tk.Tk, ABC):
         self._filetypes = (("Area files", "*.area"), ("All files", "*.*"))
         self._store = Store()
         self.unit_id = tk.IntVar(self, value=0)
+        self._next_row = 0
+        self._calc_pending = None
+        self._validate_cmd = (self.register(self._validate_entry), "%P")
 
     def _load_bindings(self):
         """add key binding to UI"""
-        self.bind("<space>", self._calc)
+        self.bind("<space>", self._schedule_calc)
         self.bind("<Return>", self._load_row)
         self.bind("<KP_Enter>", self._load_row)
 
-    def _convert_to_feet(self, value: float) -> float:
-        """convert the area value to square feets according to the unit selected.
-
-        Args:
-            value (float): area value
-
-        Returns:
-            float: area value in square feet
-        """
-        unit = self._store.units[self.unit_id.get()]
-        return round(unit["calc"](value), 2)
-
     def _load_result(self, result: float):
         """set value of result widget to converted value
 
         Args:
             result (float): calculated value from input
         """
-        unit = self._store.units[self.unit_id.get()]
+        uid = self.unit_id.get()
         self._result.set(
-            "Square {}: {}, Square Feets: {}".format(
-                unit["name"], result, self._convert_to_feet(result)
-            )
+            f"Square {_UNITS[uid]['name']}: {result},"
+            f" Square Feets: {result * _FACTORS[uid]:.2f}"
         )
 
     def _config(self, title: str):
@@ -204,9 +283,9 @@ class Window(tk.Tk, ABC):
                 self._load_row(values=row)
 
         # Caculate button
-        add_button = ttk.Button(self, text="Calculate", width=46)
-        add_button["command"] = self._calc
-        add_button.pack(fill=tk.X)
+        self._calc_button = ttk.Button(self, text="Calculate", width=46)
+        self._calc_button["command"] = self._schedule_calc
+        self._calc_button.pack(fill=tk.X)
 
         # Status bar
         ttk.Label(
@@ -218,37 +297,30 @@ class Window(tk.Tk, ABC):
         for child in self._input_frame.winfo_children():
             child.destroy()
         self._store.clear()
+        self._next_row = 0
 
-    def _validate_entry(self, new_val: str, val: str, key: str) -> bool:
+    def _validate_entry(self, new_val: str) -> bool:
         """validate if the value entered is a floating point value
 
         Args:
-            new_val (str): the value resulted after the addition of key
-            val (str): the value of the target before addition of key
-            key (str): the key pressed by user
+            new_val (str): the value resulted after the edit
 
         Returns:
             bool: True if value typed is floating point. Otherwise False
         """
-        is_digit = key.isdigit()
         if new_val == "":
             return True
-        if val == "":
-            return is_digit
-        if not (is_digit or key == "."):
+        if new_val.count(".") > 1:
             return False
-        r = re.match(r"^\d+\.?\d*$", new_val)
-        if r:
-            return True
-        return False
+        return new_val.replace(".", "", 1).isdigit() or new_val == "."
 
     def _load_entry(
-        self, frame: ttk.Frame, pos: int, focus=False, text=""
+        self, row: int, pos: int, focus=False, text=""
     ) -> tk.StringVar:
         """create a tkinter Entry widget using StringVar and return the StringVar.
 
         Args:
-            frame (ttk.Frame): parent frame
+            row (int): row position in the input frame
             pos (int): column position in the row
             focus (bool, optional): should the element be focused on creation. Defaults to False.
             text (str, optional): initial text to be set in the entry widget. Defaults to "".
@@ -256,22 +328,22 @@ class Window(tk.Tk, ABC):
         Returns:
             tk.StringVar: text variable of the entry widget
         """
-        self._text = tk.StringVar(master=self, value=text)
-        self._widget = tk.Entry(
-            frame,
+        strvar = tk.StringVar(master=self, value=text)
+        widget = tk.Entry(
+            self._input_frame,
             width=10,
             validate="key",
-            validatecommand=(frame.register(self._validate_entry), "%P", "%s", "%S"),
-            textvariable=self._text,
+            validatecommand=self._validate_cmd,
+            textvariable=strvar,
         )
 
         # add widget to grid
-        self._widget.grid(row=0, column=pos, padx=4)
+        widget.grid(row=row, column=pos, padx=4, pady=4)
 
         # set focus of widget if True
         if focus:
-            self._widget.focus_set()
-        return self._text
+            widget.focus_set()
+        return strvar
 
     def _load_row(self, e=None, values: InputRow = tuple()):
         """add row of input fields and add the string variable to storage
@@ -286,26 +358,46 @@ class Window(tk.Tk, ABC):
 
         # Defined local functions
         e = lambda x: "" if x == 0.0 else str(x)
-        xlabel = lambda f, p: ttk.Label(f, text="x", width=1).grid(row=0, column=p)
+        xlabel = lambda r, p: ttk.Label(self._input_frame, text="x", width=1).grid(
+            row=r, column=p
+        )
 
-        # Create row frame
-        row = ttk.Frame(self._input_frame, padding=4)
-        row.pack()
+        # Claim the next grid row in the shared input frame
+        idx = self._next_row
+        self._next_row += 1
 
         # Create row elements
-        text_length = self._load_entry(row, 0, True, text=e(length))
-        xlabel(row, 1)
-        text_width = self._load_entry(row, 2, text=e(width))
-        xlabel(row, 3)
-        text_count = self._load_entry(row, 4, text=e(count))
+        text_length = self._load_entry(idx, 0, True, text=e(length))
+        xlabel(idx, 1)
+        text_width = self._load_entry(idx, 2, text=e(width))
+        xlabel(idx, 3)
+        text_count = self._load_entry(idx, 4, text=e(count))
 
         # Add string variables to storage
-        delete_row = self._store.add((text_length, text_width, text_count))
+        values = (text_length, text_width, text_count)
+        self._store.add(values)
 
         # Delete button
-        remove_button = ttk.Button(row, text="Delete")
-        remove_button["command"] = delete_row(row)
-        remove_button.grid(row=0, column=5, padx=4)
+        remove_button = ttk.Button(self._input_frame, text="Delete")
+        remove_button["command"] = self._store.make_destroyer(
+            values, self._input_frame, idx
+        )
+        remove_button.grid(row=idx, column=5, padx=4)
+
+    def _schedule_calc(self, e=None):
+        """schedule a calculation on idle so bursts of events coalesce
+        into a single recompute
+
+        Args:
+            e (Event, optional): key binding event. Defaults to None.
+        """
+        if self._calc_pending is None:
+            self._calc_pending = self.after_idle(self._run_calc)
+
+    def _run_calc(self):
+        """run the pending calculation and clear the schedule flag"""
+        self._calc_pending = None
+        self._calc()
 
     @abstractmethod
     def _calc(self, e=None):
@@ -338,10 +430,23 @@ class UI(Window):
         Args:
             e (Event, optional): key binding event. Defaults to None.
         """
-        result = 0.0
-        for row in self._store.values():
-            result += row[0] * row[1] * row[2]
-        self._load_result(result)
+        count = len(self._store.storage)
+        if count >= _NUMPY_THRESHOLD:
+            # vectorised path for large imported files
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+            else:
+                arr = np.asarray(self._store.values(), dtype=np.float64)
+                if _area_kernel is not None and count >= _NUMBA_THRESHOLD:
+                    self._load_result(float(_area_kernel(arr)))
+                else:
+                    self._load_result(
+                        float((arr[:, 0] * arr[:, 1] * arr[:, 2]).sum())
+                    )
+                return
+        self._load_result(self._store.sum_products())
 
     def _new(self):
         """create new app window"""
@@ -361,7 +466,18 @@ class UI(Window):
         # load binary file
         try:
             with open(filename, "rb") as fp:
-                data = pickle.load(fp)
+                if fp.read(len(_FILE_MAGIC)) == _FILE_MAGIC:
+                    # packed format: magic, int32 unit id, N x 3 float64
+                    unit_id = struct.unpack("<i", fp.read(4))[0]
+                    values = array.array("d")
+                    values.frombytes(fp.read())
+                    data = [tuple(values[i : i + 3]) for i in range(0, len(values), 3)]
+                else:
+                    # legacy pickled format with a leading unit marker row
+                    fp.seek(0)
+                    legacy = pickle.load(fp)
+                    unit_id = int(legacy[0][2])
+                    data = legacy[1:]
         except:
             print("Failed to load file")
             return
@@ -369,10 +485,22 @@ class UI(Window):
         # load data in to UI
         if data is not None:
             self._clear_input()
-            unit, data = data[0], data[1:]
-            self.unit_id.set(int(unit[2]))
-            for row in data:
-                self._load_row(values=row)
+            self.unit_id.set(unit_id)
+
+            # freeze geometry management and hide the window for the
+            # duration of the bulk import so Tk never redraws mid-build;
+            # always re-show it even if a malformed row aborts the loop
+            self._input_frame.pack_forget()
+            self.withdraw()
+            try:
+                for row in data:
+                    self._load_row(values=row)
+            finally:
+                self._input_frame.pack(
+                    expand=True, fill=tk.BOTH, before=self._calc_button
+                )
+                self.deiconify()
+                self.update_idletasks()
             self._calc()
 
     def _save(self):
@@ -386,12 +514,15 @@ class UI(Window):
             parent=self.menu,
         )
 
-        # get values from store and save it as binary file
+        # get values from store and save it as packed binary file
         try:
-            data = self._store.values()
-            data.insert(0, (-1, -1, self.unit_id.get()))
+            values = array.array("d")
+            for row in self._store.values():
+                values.extend(row)
             with open(filename, "wb") as fp:
-                pickle.dump(data, fp)
+                fp.write(_FILE_MAGIC)
+                fp.write(struct.pack("<i", self.unit_id.get()))
+                fp.write(values.tobytes())
         except:
             print("Failed to save file")
 